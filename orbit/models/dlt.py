@@ -2,7 +2,8 @@ import pandas as pd
 from scipy.stats import nct
 import torch
 import numpy as np
-from copy import deepcopy
+from collections import namedtuple
+from numba import njit, prange, get_num_threads
 
 from ..constants import dlt as constants
 from ..constants.constants import (
@@ -20,6 +21,84 @@ from ..exceptions import IllegalArgument, ModelException
 from ..initializer.dlt import DLTInitializer
 
 
+# posterior tensors consumed by `BaseDLT._predict()`; fields absent from the model are None
+DLTPosteriorTensors = namedtuple(
+    'DLTPosteriorTensors',
+    [
+        'local_trend', 'last_local_trend_level', 'last_local_trend_slope',
+        'level_smoothing_factor', 'slope_smoothing_factor',
+        'residual_degree_of_freedom', 'residual_sigma',
+        'seasonality_levels', 'seasonality_smoothing_factor',
+        'global_trend', 'global_trend_level', 'global_trend_slope',
+        'regressor_beta',
+    ]
+)
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _forecast_local_trend(local_trend, seasonal_component, last_level, last_slope, damped_factor,
+                          level_smoothing_factor, slope_smoothing_factor, seasonality_smoothing_factor,
+                          error, seasonality, trained_len, num_of_tiles):
+    """Out-of-sample recursion of DLT local trend and seasonality
+
+    Samples are independent of each other while time steps are sequential. Hence, samples are
+    split into one contiguous tile per thread and each sample carries its own level and slope
+    states over time. All 2d arrays are laid out as (num_sample, time) such that every thread
+    works on its own block of rows. `local_trend` and `seasonal_component` are updated in place
+    from index `trained_len` onwards.
+
+    Parameters
+    ----------
+    local_trend : 2d array
+        local trend of shape (num_sample, full_len)
+    seasonal_component : 2d array
+        seasonality of shape (num_sample, full_len); ignored if `seasonality` <= 1
+    last_level : 1d array
+        local trend levels at the end of training period
+    last_slope : 1d array
+        local trend slopes at the end of training period
+    damped_factor : float
+    level_smoothing_factor : 1d array
+    slope_smoothing_factor : 1d array
+    seasonality_smoothing_factor : 1d array
+    error : 2d array
+        residuals of shape (num_sample, full_len - trained_len) added to local trend
+    seasonality : int
+    trained_len : int
+    num_of_tiles : int
+        number of sample tiles processed in parallel, usually the number of threads
+    """
+    num_sample, full_len = local_trend.shape
+    num_of_tiles = max(min(num_of_tiles, num_sample), 1)
+    tile_size = (num_sample + num_of_tiles - 1) // num_of_tiles
+    for tile in prange(num_of_tiles):
+        for s in range(tile * tile_size, min((tile + 1) * tile_size, num_sample)):
+            level = last_level[s]
+            slope = last_slope[s]
+            # smoothing factors are constant over time; load them once per sample since the compiler
+            # cannot hoist the loads out of the time loop while outputs are written in place.
+            # updates below take the form old + sm * (new - old) == sm * new + (1 - sm) * old
+            # such that the complements (1 - sm) are never required
+            lev_sm = level_smoothing_factor[s]
+            slp_sm = slope_smoothing_factor[s]
+            sea_sm = seasonality_smoothing_factor[s]
+            for idx in range(trained_len, full_len):
+                curr_local_trend = level + damped_factor * slope
+                # for convenience, we lump error on local trend
+                observed_local_trend = curr_local_trend + error[s, idx - trained_len]
+                local_trend[s, idx] = observed_local_trend
+                # now local trend contains the error term and hence we need to use
+                # curr_local_trend as a proxy of previous level index
+                new_level = curr_local_trend + lev_sm * (observed_local_trend - curr_local_trend)
+                damped_slope = damped_factor * slope
+                slope = damped_slope + slp_sm * (new_level - level - damped_slope)
+                if seasonality > 1 and idx + seasonality < full_len:
+                    curr_seasonality = seasonal_component[s, idx]
+                    seasonal_component[s, idx + seasonality] = \
+                        curr_seasonality + sea_sm * (observed_local_trend - new_level)
+                level = new_level
+
+
 class BaseDLT(BaseETS):
     """Base DLT model object with shared functionality for Full, Aggregated, and MAP methods
 
@@ -59,6 +138,9 @@ class BaseDLT(BaseETS):
         global trend value. Default, 0.8
     global_trend_option : { 'flat', 'linear', 'loglinear', 'logistic' }
         Transformation function for the shape of the forecasted global trend.
+    predict_dtype : { torch.double, torch.float }
+        Floating point precision used in prediction. Default, torch.double. torch.float halves the
+        memory traffic of prediction at the cost of precision.
 
     Other Parameters
     ----------------
@@ -78,10 +160,12 @@ class BaseDLT(BaseETS):
                  regressor_beta_prior=None, regressor_sigma_prior=None,
                  regression_penalty='fixed_ridge', lasso_scale=0.5, auto_ridge_scale=0.5,
                  slope_sm_input=None,
-                 period=1, damped_factor=0.8, global_trend_option='linear', **kwargs):
+                 period=1, damped_factor=0.8, global_trend_option='linear', predict_dtype=torch.double,
+                 **kwargs):
 
         self.damped_factor = damped_factor
         self.global_trend_option = global_trend_option
+        self.predict_dtype = predict_dtype
         self.period = period
         # extra parameters for residuals
         self.min_nu = 5.
@@ -163,6 +247,10 @@ class BaseDLT(BaseETS):
             raise IllegalArgument("{} is not one of 'flat', 'linear', 'loglinear', or 'logistic'".
                                   format(self.global_trend_option))
 
+    def _validate_predict_dtype(self):
+        if self.predict_dtype not in [torch.double, torch.float]:
+            raise IllegalArgument("{} is not one of torch.double or torch.float".format(self.predict_dtype))
+
     def _validate_regression_penalties(self):
         if self.regression_penalty not in ['fixed_ridge', 'lasso', 'auto_ridge']:
             raise IllegalArgument("{} is not one of 'fixed_ridge', 'lasso', 'auto_ridge'".
@@ -257,6 +345,7 @@ class BaseDLT(BaseETS):
         It sets additional required attributes related to trend and regression
         """
         super()._set_static_attributes()
+        self._validate_predict_dtype()
         self._set_additional_trend_attributes()
         self._set_regression_default_attributes()
         self._set_regression_penalty()
@@ -324,6 +413,50 @@ class BaseDLT(BaseETS):
         self._validate_training_df_with_regression(df)
         self._set_regressor_matrix(df)  # depends on num_of_observations
 
+    def _get_posterior_tensors(self, posterior_estimates):
+        """Collect posteriors required by `_predict()` into tensors of `predict_dtype`
+
+        Tensors share memory with `posterior_estimates` whenever no cast is required; hence, they
+        must not be updated in place. Posteriors which are not part of the model are set to None.
+        """
+        def _to_tensor(param_name, idx=None):
+            value = posterior_estimates.get(param_name)
+            if value is None:
+                return None
+            # only the required slice is converted
+            if idx is not None:
+                value = value[idx]
+            return torch.from_numpy(value).to(self.predict_dtype)
+
+        global_trend_level = _to_tensor(constants.GlobalTrendSamplingParameters.GLOBAL_TREND_LEVEL.value)
+        global_trend_slope = _to_tensor(constants.GlobalTrendSamplingParameters.GLOBAL_TREND_SLOPE.value)
+        # regression coefficients are always 2d with shape (num_sample, num_of_regressors)
+        regressor_beta = _to_tensor(constants.RegressionSamplingParameters.REGRESSION_COEFFICIENTS.value)
+        if regressor_beta is not None and regressor_beta.dim() == 1:
+            regressor_beta = regressor_beta.reshape(1, -1)
+
+        return DLTPosteriorTensors(
+            local_trend=_to_tensor(constants.BaseSamplingParameters.LOCAL_TREND.value),
+            last_local_trend_level=_to_tensor(
+                constants.BaseSamplingParameters.LOCAL_TREND_LEVELS.value, idx=(slice(None), -1)),
+            last_local_trend_slope=_to_tensor(
+                constants.BaseSamplingParameters.LOCAL_TREND_SLOPES.value, idx=(slice(None), -1)),
+            level_smoothing_factor=_to_tensor(constants.BaseSamplingParameters.LEVEL_SMOOTHING_FACTOR.value),
+            slope_smoothing_factor=_to_tensor(constants.BaseSamplingParameters.SLOPE_SMOOTHING_FACTOR.value),
+            residual_degree_of_freedom=_to_tensor(
+                constants.BaseSamplingParameters.RESIDUAL_DEGREE_OF_FREEDOM.value),
+            residual_sigma=_to_tensor(constants.BaseSamplingParameters.RESIDUAL_SIGMA.value),
+            seasonality_levels=_to_tensor(constants.SeasonalitySamplingParameters.SEASONALITY_LEVELS.value),
+            seasonality_smoothing_factor=_to_tensor(
+                constants.SeasonalitySamplingParameters.SEASONALITY_SMOOTHING_FACTOR.value),
+            global_trend=_to_tensor(constants.GlobalTrendSamplingParameters.GLOBAL_TREND.value),
+            global_trend_level=global_trend_level.reshape(-1) if global_trend_level is not None else None,
+            global_trend_slope=global_trend_slope.reshape(-1) if global_trend_slope is not None else None,
+            regressor_beta=regressor_beta,
+        )
+
+    # no gradient is taken in prediction; skip autograd bookkeeping of every tensor op
+    @torch.inference_mode()
     def _predict(self, posterior_estimates, df=None, include_error=False, **kwargs):
         """Vectorized version of prediction math"""
         ################################################################
@@ -334,72 +467,37 @@ class BaseDLT(BaseETS):
         trained_len = self.num_of_observations
         output_len = self.prediction_input_meta['df_length']
         full_len = trained_len + n_forecast_steps
+        predict_dtype = self.predict_dtype
 
         ################################################################
         # Model Attributes
         ################################################################
-        model = deepcopy(posterior_estimates)
-        for k, v in model.items():
-            model[k] = torch.from_numpy(v)
-
-        # We can pull any arbitrary value from teh dictionary because we hold the
-        # safe assumption: the length of the first dimension is always the number of samples
-        # thus can be safely used to determine `num_sample`. If predict_method is anything
-        # other than full, the value here should be 1
-        arbitrary_posterior_value = list(model.values())[0]
-        num_sample = arbitrary_posterior_value.shape[0]
-
-        # seasonality components
-        seasonality_levels = model.get(
-            constants.SeasonalitySamplingParameters.SEASONALITY_LEVELS.value)
-        seasonality_smoothing_factor = model.get(
-            constants.SeasonalitySamplingParameters.SEASONALITY_SMOOTHING_FACTOR.value
-        )
-
-        # trend components
-        slope_smoothing_factor = model.get(
-            constants.BaseSamplingParameters.SLOPE_SMOOTHING_FACTOR.value)
-        level_smoothing_factor = model.get(
-            constants.BaseSamplingParameters.LEVEL_SMOOTHING_FACTOR.value)
-        local_trend_levels = model.get(constants.BaseSamplingParameters.LOCAL_TREND_LEVELS.value)
-        local_trend_slopes = model.get(constants.BaseSamplingParameters.LOCAL_TREND_SLOPES.value)
-        local_trend = model.get(constants.BaseSamplingParameters.LOCAL_TREND.value)
-        residual_degree_of_freedom = model.get(
-            constants.BaseSamplingParameters.RESIDUAL_DEGREE_OF_FREEDOM.value)
-        residual_sigma = model.get(constants.BaseSamplingParameters.RESIDUAL_SIGMA.value)
-
-        # set an additional attribute for damped factor when it is fixed
-        # get it through user input field
-        damped_factor = torch.empty(num_sample, dtype=torch.double)
-        damped_factor.fill_(self.damped_factor)
+        posterior = self._get_posterior_tensors(posterior_estimates)
+        num_sample = posterior.local_trend.shape[0]
 
         if self._global_trend_option != constants.GlobalTrendOption.flat.value:
-            global_trend_level = model.get(constants.GlobalTrendSamplingParameters.GLOBAL_TREND_LEVEL.value).view(
-                num_sample, )
-            global_trend_slope = model.get(constants.GlobalTrendSamplingParameters.GLOBAL_TREND_SLOPE.value).view(
-                num_sample, )
-            global_trend = model.get(constants.GlobalTrendSamplingParameters.GLOBAL_TREND.value)
+            global_trend_level = posterior.global_trend_level
+            global_trend_slope = posterior.global_trend_slope
+            global_trend = posterior.global_trend
         else:
-            global_trend = torch.zeros(local_trend.shape, dtype=torch.double)
-            global_trend_level = torch.zeros(local_trend.shape, dtype=torch.double)
-            global_trend_slope = torch.zeros(local_trend.shape, dtype=torch.double)
-
-        # regression components
-        regressor_beta = model.get(constants.RegressionSamplingParameters.REGRESSION_COEFFICIENTS.value)
+            global_trend = torch.zeros(posterior.local_trend.shape, dtype=predict_dtype)
+            global_trend_level = torch.zeros(posterior.local_trend.shape, dtype=predict_dtype)
+            global_trend_slope = torch.zeros(posterior.local_trend.shape, dtype=predict_dtype)
 
         ################################################################
         # Regression Component
         ################################################################
         # calculate regression component
-        if self.regressor_col is not None and len(self.regressor_col) > 0:
-            regressor_beta = regressor_beta.t()
-            regressor_matrix = df[self._regressor_col].values
-            regressor_torch = torch.from_numpy(regressor_matrix).double()
-            regression = torch.matmul(regressor_torch, regressor_beta)
-            regression = regression.t()
+        if posterior.regressor_beta is not None:
+            # materialize the regressor columns only
+            regressor_matrix = np.ascontiguousarray(df[self._regressor_col].to_numpy(dtype=np.double))
+            regressor_torch = torch.from_numpy(regressor_matrix).to(predict_dtype)
+            # (num_sample, num_of_regressors) x (num_of_regressors, output_len); the transposed
+            # operand is passed to gemm as is, so the result comes out in the final layout
+            regression = torch.matmul(posterior.regressor_beta, regressor_torch.t())
         else:
             # regressor is always dependent with df. hence, no need to make full size
-            regression = torch.zeros((num_sample, output_len), dtype=torch.double)
+            regression = torch.zeros((num_sample, output_len), dtype=predict_dtype)
 
         ################################################################
         # Seasonality Component
@@ -407,16 +505,15 @@ class BaseDLT(BaseETS):
 
         # calculate seasonality component
         if self._seasonality > 1:
-            if full_len <= seasonality_levels.shape[1]:
-                seasonal_component = seasonality_levels[:, :full_len]
+            if full_len <= posterior.seasonality_levels.shape[1]:
+                seasonal_component = posterior.seasonality_levels[:, :full_len]
             else:
-                seasonality_forecast_length = full_len - seasonality_levels.shape[1]
-                seasonality_forecast_matrix = \
-                    torch.zeros((num_sample, seasonality_forecast_length), dtype=torch.double)
-                seasonal_component = torch.cat(
-                    (seasonality_levels, seasonality_forecast_matrix), dim=1)
+                # the forecast tail is left uninitialized; it is fully written by the
+                # out-of-sample recursion below since full_len > trained_len + seasonality here
+                seasonal_component = torch.empty((num_sample, full_len), dtype=predict_dtype)
+                seasonal_component[:, :posterior.seasonality_levels.shape[1]] = posterior.seasonality_levels
         else:
-            seasonal_component = torch.zeros((num_sample, full_len), dtype=torch.double)
+            seasonal_component = torch.zeros((num_sample, full_len), dtype=predict_dtype)
 
         ################################################################
         # Trend Component
@@ -425,110 +522,116 @@ class BaseDLT(BaseETS):
         # calculate level component.
         # However, if predicted end of period > training period, update with out-of-samples forecast
         if full_len <= trained_len:
-            full_local_trend = local_trend[:, :full_len]
+            full_local_trend = posterior.local_trend[:, :full_len]
             full_global_trend = global_trend[:, :full_len]
 
             # in-sample error are iids
             if include_error:
                 error_value = nct.rvs(
-                    df=residual_degree_of_freedom.unsqueeze(-1),
+                    df=posterior.residual_degree_of_freedom.unsqueeze(-1),
                     nc=0,
                     loc=0,
-                    scale=residual_sigma.unsqueeze(-1),
+                    scale=posterior.residual_sigma.unsqueeze(-1),
                     size=(num_sample, full_len)
                 )
 
-                error_value = torch.from_numpy(error_value.reshape(num_sample, full_len)).double()
-                full_local_trend += error_value
+                error_value = torch.from_numpy(error_value.reshape(num_sample, full_len)).to(predict_dtype)
+                full_local_trend = full_local_trend + error_value
         else:
             trend_forecast_length = full_len - trained_len
-            trend_forecast_init = torch.zeros((num_sample, trend_forecast_length), dtype=torch.double)
-            full_local_trend = local_trend[:, :full_len]
+            # the forecast tails are left uninitialized and fully written below
+            full_local_trend = torch.empty((num_sample, full_len), dtype=predict_dtype)
+            full_local_trend[:, :trained_len] = posterior.local_trend
+            full_global_trend = torch.empty((num_sample, full_len), dtype=predict_dtype)
+            full_global_trend[:, :trained_len] = global_trend
             # for convenience, we lump error on local trend since the formula would
             # yield the same as yhat + noise - global_trend - seasonality - regression
             # equivalent with local_trend + noise
             # in-sample error are iids
             if include_error:
                 error_value = nct.rvs(
-                    df=residual_degree_of_freedom.unsqueeze(-1),
+                    df=posterior.residual_degree_of_freedom.unsqueeze(-1),
                     nc=0,
                     loc=0,
-                    scale=residual_sigma.unsqueeze(-1),
-                    size=(num_sample, full_local_trend.shape[1])
+                    scale=posterior.residual_sigma.unsqueeze(-1),
+                    size=(num_sample, trained_len)
                 )
 
-                error_value = torch.from_numpy(
-                    error_value.reshape(num_sample, full_local_trend.shape[1])).double()
-                full_local_trend += error_value
+                error_value = torch.from_numpy(error_value.reshape(num_sample, trained_len)).to(predict_dtype)
+                full_local_trend[:, :trained_len] += error_value
+
+            # global trend has no temporal dependency; compute the entire forecast horizon at once
+            # with shape (num_sample, trend_forecast_length)
+            # idx = time - 1
+            forecast_time = torch.arange(trained_len, full_len, dtype=predict_dtype) * self._time_delta
+            if self.global_trend_option != constants.GlobalTrendOption.flat.name:
+                global_trend_level = global_trend_level.unsqueeze(-1)
+                global_trend_slope = global_trend_slope.unsqueeze(-1)
+            if self.global_trend_option == constants.GlobalTrendOption.linear.name:
+                full_global_trend[:, trained_len:] = \
+                    global_trend_level + global_trend_slope * forecast_time
+            elif self.global_trend_option == constants.GlobalTrendOption.loglinear.name:
+                full_global_trend[:, trained_len:] = \
+                    global_trend_level + torch.log1p(global_trend_slope * forecast_time)
+            elif self.global_trend_option == constants.GlobalTrendOption.logistic.name:
+                full_global_trend[:, trained_len:] = \
+                    global_trend_level / (1 + torch.exp(-1 * global_trend_slope * forecast_time))
+            else:
+                full_global_trend[:, trained_len:] = 0.
 
-            full_local_trend = torch.cat((full_local_trend, trend_forecast_init), dim=1)
-            full_global_trend = torch.cat((global_trend[:, :full_len], trend_forecast_init), dim=1)
-            last_local_trend_level = local_trend_levels[:, -1]
-            last_local_trend_slope = local_trend_slopes[:, -1]
+            # draw out-of-sample errors for the entire forecast horizon in a single call
+            # with shape (num_sample, trend_forecast_length)
+            if include_error:
+                forecast_error_value = nct.rvs(
+                    df=posterior.residual_degree_of_freedom.unsqueeze(-1),
+                    nc=0,
+                    loc=0,
+                    scale=posterior.residual_sigma.unsqueeze(-1),
+                    size=(num_sample, trend_forecast_length)
+                )
+                forecast_error_value = torch.from_numpy(forecast_error_value).to(predict_dtype)
+            else:
+                forecast_error_value = torch.zeros((num_sample, trend_forecast_length), dtype=predict_dtype)
 
-            for idx in range(trained_len, full_len):
-                # based on model, split cases for trend update
-                curr_local_trend = \
-                    last_local_trend_level + damped_factor.flatten() * last_local_trend_slope
-                full_local_trend[:, idx] = curr_local_trend
-                # idx = time - 1
-                if self.global_trend_option == constants.GlobalTrendOption.linear.name:
-                    full_global_trend[:, idx] = \
-                        global_trend_level + global_trend_slope * idx * self._time_delta
-                elif self.global_trend_option == constants.GlobalTrendOption.loglinear.name:
-                    full_global_trend[:, idx] = \
-                        global_trend_level + torch.log(1 + global_trend_slope * idx * self._time_delta)
-                elif self.global_trend_option == constants.GlobalTrendOption.logistic.name:
-                    full_global_trend[:, idx] = \
-                        global_trend_level / (1 + torch.exp(-1 * global_trend_slope * idx * self._time_delta))
-                elif self._global_trend_option == constants.GlobalTrendOption.flat.name:
-                    full_global_trend[:, idx] = 0
-
-                if include_error:
-                    error_value = nct.rvs(
-                        df=residual_degree_of_freedom,
-                        nc=0,
-                        loc=0,
-                        scale=residual_sigma,
-                        size=num_sample
-                    )
-                    error_value = torch.from_numpy(error_value).double()
-                    full_local_trend[:, idx] += error_value
-
-                # now full_local_trend contains the error term and hence we need to use
-                # curr_local_trend as a proxy of previous level index
-                new_local_trend_level = \
-                    level_smoothing_factor * full_local_trend[:, idx] \
-                    + (1 - level_smoothing_factor) * curr_local_trend
-                last_local_trend_slope = \
-                    slope_smoothing_factor * (new_local_trend_level - last_local_trend_level) \
-                    + (1 - slope_smoothing_factor) * damped_factor.flatten() * last_local_trend_slope
-
-                if self._seasonality > 1 and idx + self._seasonality < full_len:
-                    seasonal_component[:, idx + self._seasonality] = \
-                        seasonality_smoothing_factor.flatten() \
-                        * (full_local_trend[:, idx] + seasonal_component[:, idx] -
-                           new_local_trend_level) \
-                        + (1 - seasonality_smoothing_factor.flatten()) * seasonal_component[:, idx]
-
-                last_local_trend_level = new_local_trend_level
+            if self._seasonality > 1:
+                seasonality_smoothing_factor_flat = posterior.seasonality_smoothing_factor.reshape(-1)
+            else:
+                seasonality_smoothing_factor_flat = torch.zeros(num_sample, dtype=predict_dtype)
+
+            # local trend and seasonality are updated recursively; tensors are on cpu
+            # and share memory with the numpy views, hence results are written in place
+            _forecast_local_trend(
+                local_trend=full_local_trend.numpy(),
+                seasonal_component=seasonal_component.numpy(),
+                last_level=posterior.last_local_trend_level.numpy(),
+                last_slope=posterior.last_local_trend_slope.numpy(),
+                # damped factor is a fixed user input shared by all samples; pass it as a scalar
+                damped_factor=float(self.damped_factor),
+                level_smoothing_factor=posterior.level_smoothing_factor.reshape(-1).numpy(),
+                slope_smoothing_factor=posterior.slope_smoothing_factor.reshape(-1).numpy(),
+                seasonality_smoothing_factor=seasonality_smoothing_factor_flat.numpy(),
+                error=forecast_error_value.numpy(),
+                seasonality=self._seasonality,
+                trained_len=trained_len,
+                num_of_tiles=get_num_threads(),
+            )
 
         ################################################################
         # Combine Components
         ################################################################
 
         # trim component with right start index
-        trend_component = full_global_trend[:, start:] + full_local_trend[:, start:]
-        seasonal_component = seasonal_component[:, start:]
-
-        # sum components
-        pred_array = trend_component + seasonal_component + regression
-
-        pred_array = pred_array.numpy()
-        trend_component = trend_component.numpy()
-        seasonal_component = seasonal_component.numpy()
+        # no torch op is needed beyond this point; continue with zero-copy numpy views
+        trend_component = np.add(full_global_trend[:, start:].numpy(), full_local_trend[:, start:].numpy())
+        # seasonality can be a view of the posteriors (e.g. in-sample or within one seasonal period);
+        # copy it such that the returned component never aliases the fitted model
+        seasonal_component = seasonal_component[:, start:].numpy().copy()
         regression = regression.numpy()
 
+        # sum components; accumulate into a single fresh buffer
+        pred_array = np.add(trend_component, seasonal_component)
+        pred_array += regression
+
         out = {
             PredictionKeys.PREDICTION.value: pred_array,
             PredictionKeys.TREND.value: trend_component,
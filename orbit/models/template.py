@@ -58,6 +58,8 @@ class BaseTemplate(object, metaclass=ci.DocInheritMeta(style="numpy_with_merge_d
         # mainly set by ._set_training_df_meta() and ._set_dynamic_attributes()
         self.response = None
         self.date_array = None
+        # int64 (nanosecond) representation of `date_array` for matching prediction dates
+        self.date_array_int64 = None
         self.num_of_observations = None
         self.training_start = None
         self.training_end = None
@@ -147,6 +149,7 @@ class BaseTemplate(object, metaclass=ci.DocInheritMeta(style="numpy_with_merge_d
     def _set_training_df_meta(self, df):
         self.response = df[self.response_col].values
         self.date_array = pd.to_datetime(df[self.date_col]).reset_index(drop=True)
+        self.date_array_int64 = self.date_array.values.astype('datetime64[ns]').view('i8')
         self.num_of_observations = len(self.response)
         self.response_sd = np.nanstd(self.response)
         self.training_start = df[self.date_col].iloc[0]
@@ -256,9 +259,6 @@ class BaseTemplate(object, metaclass=ci.DocInheritMeta(style="numpy_with_merge_d
         return self._training_metrics.copy()
 
     def get_prediction_input_meta(self, df):
-        # remove reference from original input
-        df = df.copy()
-
         # get prediction df meta
         prediction_input_meta = {
             'date_array': pd.to_datetime(df[self.date_col]).reset_index(drop=True),
@@ -280,22 +280,25 @@ class BaseTemplate(object, metaclass=ci.DocInheritMeta(style="numpy_with_merge_d
         # If we cannot find a match of prediction range, assume prediction starts right after train
         # end
         if prediction_input_meta['prediction_start'] > self.training_end:
-            forecast_dates = set(prediction_input_meta['date_array'])
-            n_forecast_steps = len(forecast_dates)
+            n_forecast_steps = prediction_input_meta['df_length']
             # time index for prediction start
             start = trained_len
         else:
+            # both date arrays are ordered and unique; match them with a binary search
+            # on the int64 (nanosecond) representation
+            training_dates = self.date_array_int64
+            prediction_dates = prediction_input_meta['date_array'].values.astype('datetime64[ns]').view('i8')
+            matched_idx = np.searchsorted(training_dates, prediction_dates)
+            is_matched = training_dates[np.minimum(matched_idx, trained_len - 1)] == prediction_dates
+            num_of_matched = np.count_nonzero(is_matched)
             # compute how many steps to forecast
-            forecast_dates = \
-                set(prediction_input_meta['date_array']) - set(self.date_array)
             # check if prediction df is a subset of training df
             # e.g. "negative" forecast steps
-            n_forecast_steps = len(forecast_dates) or - (
-                len(set(self.date_array) - set(prediction_input_meta['date_array']))
-            )
+            n_forecast_steps = (len(prediction_dates) - num_of_matched) or - (trained_len - num_of_matched)
             # time index for prediction start
-            start = pd.Index(
-                self.date_array).get_loc(prediction_input_meta['prediction_start'])
+            if not is_matched[0]:
+                raise PredictionException('Prediction start must match one of the training dates.')
+            start = int(matched_idx[0])
 
         prediction_input_meta.update({
             'start': start,
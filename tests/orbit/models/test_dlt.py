@@ -1,11 +1,14 @@
 import pytest
 import numpy as np
+import pandas as pd
+import torch
 from copy import copy
 
 from orbit.models.dlt import DLTFull, DLTAggregated, DLTMAP
 from orbit.estimators.stan_estimator import StanEstimatorMCMC, StanEstimatorVI
 from orbit.initializer.dlt import DLTInitializer
 from orbit.diagnostics.backtest import grid_search_orbit
+from orbit.exceptions import IllegalArgument
 
 
 @pytest.mark.parametrize("model_class", [DLTMAP, DLTFull, DLTAggregated])
@@ -269,6 +272,104 @@ def test_dlt_map_global_trend(synthetic_data, global_trend_option):
     assert predict_df.columns.tolist() == expected_columns
 
 
+def _forecast_reference(dlt, n_forecast_steps):
+    """Pure NumPy out-of-sample recursion of DLT on MAP posteriors; returns forecasted trend and seasonality"""
+    posteriors = {k: np.squeeze(v, 0) for k, v in dlt._aggregate_posteriors['map'].items()}
+    trained_len = dlt.num_of_observations
+    full_len = trained_len + n_forecast_steps
+    seasonality = dlt._seasonality
+    damped_factor = dlt.damped_factor
+    lev_sm, slp_sm, sea_sm = posteriors['lev_sm'], posteriors['slp_sm'], posteriors['sea_sm']
+    gl, gb = np.squeeze(posteriors['gl']), np.squeeze(posteriors['gb'])
+
+    local_trend = np.concatenate([posteriors['lt_sum'], np.zeros(n_forecast_steps)])
+    global_trend = np.concatenate([posteriors['gt_sum'], np.zeros(n_forecast_steps)])
+    seasonal = posteriors['s']
+    seasonal = np.concatenate([seasonal, np.zeros(max(full_len - len(seasonal), 0))])[:full_len]
+    level = posteriors['l'][-1]
+    slope = posteriors['b'][-1]
+    for idx in range(trained_len, full_len):
+        curr_local_trend = level + damped_factor * slope
+        local_trend[idx] = curr_local_trend
+        if dlt.global_trend_option == 'linear':
+            global_trend[idx] = gl + gb * idx * dlt._time_delta
+        else:
+            global_trend[idx] = gl + np.log(1 + gb * idx * dlt._time_delta)
+        new_level = lev_sm * local_trend[idx] + (1 - lev_sm) * curr_local_trend
+        slope = slp_sm * (new_level - level) + (1 - slp_sm) * damped_factor * slope
+        if idx + seasonality < full_len:
+            seasonal[idx + seasonality] = \
+                sea_sm * (local_trend[idx] + seasonal[idx] - new_level) + (1 - sea_sm) * seasonal[idx]
+        level = new_level
+
+    trend = global_trend + local_trend
+    return trend[trained_len:], seasonal[trained_len:]
+
+
+@pytest.mark.parametrize("global_trend_option", ["linear", "loglinear"])
+@pytest.mark.parametrize("n_forecast_steps", [30, 60], ids=['within_seasonality', 'beyond_seasonality'])
+def test_dlt_map_forecast_values(synthetic_data, global_trend_option, n_forecast_steps):
+    train_df, test_df, coef = synthetic_data
+
+    dlt = DLTMAP(
+        response_col='response',
+        date_col='week',
+        seasonality=52,
+        global_trend_option=global_trend_option,
+        n_bootstrap_draws=-1,
+    )
+
+    dlt.fit(train_df)
+
+    # forecast right after training end; 60 steps goes beyond the seasonality posteriors
+    # of length (num_of_observations + seasonality) and hence extends them
+    future_df = pd.DataFrame({
+        'week': pd.date_range(start=train_df['week'].iloc[-1], periods=n_forecast_steps + 1, freq='7D')[1:]
+    })
+    predict_df = dlt.predict(future_df)
+    expected_trend, expected_seasonality = _forecast_reference(dlt, n_forecast_steps)
+
+    assert np.allclose(predict_df['trend'].values, expected_trend)
+    assert np.allclose(predict_df['seasonality'].values, expected_seasonality)
+
+
+def test_dlt_map_predict_dtype(synthetic_data):
+    train_df, test_df, coef = synthetic_data
+
+    dlt = DLTMAP(
+        response_col='response',
+        date_col='week',
+        seasonality=52,
+        regressor_col=train_df.columns.tolist()[2:],
+        seed=2020,
+    )
+    dlt.fit(train_df)
+    predict_df = dlt.predict(test_df, decompose=True)
+
+    dlt_float = DLTMAP(
+        response_col='response',
+        date_col='week',
+        seasonality=52,
+        regressor_col=train_df.columns.tolist()[2:],
+        seed=2020,
+        predict_dtype=torch.float,
+    )
+    dlt_float.fit(train_df)
+    predict_df_float = dlt_float.predict(test_df, decompose=True)
+
+    assert predict_df_float.shape == predict_df.shape
+    assert predict_df_float.columns.tolist() == predict_df.columns.tolist()
+    for col in ['prediction', 'trend', 'seasonality', 'regression']:
+        assert predict_df[col].dtype == np.float64
+        assert predict_df_float[col].dtype == np.float32
+    assert np.allclose(predict_df_float['prediction'].values, predict_df['prediction'].values, atol=1e-3)
+
+
+def test_dlt_invalid_predict_dtype():
+    with pytest.raises(IllegalArgument):
+        DLTMAP(predict_dtype=torch.half)
+
+
 @pytest.mark.parametrize(
     "regressor_signs",
     [
@@ -0,0 +1,63 @@
+import pytest
+import pandas as pd
+
+from orbit.models.dlt import DLTMAP
+from orbit.exceptions import PredictionException
+
+
+@pytest.fixture
+def dlt_with_training_meta(synthetic_data):
+    train_df, test_df, coef = synthetic_data
+    dlt = DLTMAP(
+        response_col='response',
+        date_col='week',
+        seasonality=52,
+    )
+    # only training meta is required to derive prediction input meta
+    dlt._set_training_df_meta(train_df)
+
+    return dlt, train_df, test_df
+
+
+def test_prediction_input_meta_in_sample_prefix(dlt_with_training_meta):
+    dlt, train_df, test_df = dlt_with_training_meta
+    predict_df = train_df.iloc[:100]
+
+    dlt.get_prediction_input_meta(predict_df)
+    meta = dlt.prediction_input_meta
+
+    assert meta['start'] == 0
+    # "negative" forecast steps
+    assert meta['n_forecast_steps'] == 100 - len(train_df)
+
+
+def test_prediction_input_meta_in_sample_to_forecast(dlt_with_training_meta):
+    dlt, train_df, test_df = dlt_with_training_meta
+    predict_df = pd.concat([train_df.iloc[150:], test_df])
+
+    dlt.get_prediction_input_meta(predict_df)
+    meta = dlt.prediction_input_meta
+
+    assert meta['start'] == 150
+    assert meta['n_forecast_steps'] == len(test_df)
+
+
+def test_prediction_input_meta_forecast_only(dlt_with_training_meta):
+    dlt, train_df, test_df = dlt_with_training_meta
+
+    dlt.get_prediction_input_meta(test_df)
+    meta = dlt.prediction_input_meta
+
+    assert meta['start'] == len(train_df)
+    assert meta['n_forecast_steps'] == len(test_df)
+
+
+def test_prediction_input_meta_unmatched_start(dlt_with_training_meta):
+    dlt, train_df, test_df = dlt_with_training_meta
+    # start between two weekly training dates
+    predict_df = pd.DataFrame({
+        'week': pd.date_range(start=train_df['week'].iloc[10] + pd.Timedelta(days=3), periods=20, freq='7D')
+    })
+
+    with pytest.raises(PredictionException):
+        dlt.get_prediction_input_meta(predict_df)